@@ -1,9 +1,29 @@
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+# Monkey-patch stdlib sockets before anything else imports them so gevent
+# workers can multiplex blocking downstream I/O. Only the gevent pool sets
+# GEVENT_WORKERS (via raw_env in gunicorn.conf.py); patching the gthread
+# compute pool would turn its threads into greenlets on one hub and
+# serialise the CPU-bound routes it exists to isolate
 import os
+from gevent import monkey
+if os.environ.get('GEVENT_WORKERS') == '1':
+    monkey.patch_all()
+
+from flask import Flask, request, jsonify, Response
+from flask.json.provider import DefaultJSONProvider
+from flask_cors import CORS
+from flask_compress import Compress
+from pydantic import BaseModel, Field, ValidationError
 from datetime import datetime
+from functools import wraps
+from typing import Any, Dict, List, Optional
 import logging
 import asyncio
+import concurrent.futures
+import threading
+import time
+import orjson
+import redis
+import uvloop
 
 # Import our modules
 from services.stock_predictor import StockPredictor
@@ -14,31 +34,137 @@ from services.portfolio_analyzer import PortfolioAnalyzer
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson so every jsonify() call uses it.
+
+    OPT_SERIALIZE_NUMPY lets the services return NumPy scalars/arrays
+    without float()/tolist() conversions.
+    """
+
+    @staticmethod
+    def _default(obj):
+        # Sets (e.g. the chatbot's stock_interests_set sidecar) go out as
+        # lists; anything else falls back to its string form
+        if isinstance(obj, (set, frozenset)):
+            return list(obj)
+        return str(obj)
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                            default=self._default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+Flask.json_provider_class = ORJSONProvider
+
 app = Flask(__name__)
 CORS(app)
 
+# Skip Werkzeug's redirect branch for trailing slashes; one match per request
+app.url_map.strict_slashes = False
+
+# Compress large JSON responses (brotli fast mode, gzip fallback)
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_BR_LEVEL'] = 4
+Compress(app)
+
+# Persistent event loop running in a background thread so /chat doesn't pay
+# loop setup/teardown on every request. Under gevent the "thread" is a
+# greenlet, and uvloop's run_forever is a blocking libuv call that never
+# yields to the hub — it would freeze the whole worker. The stdlib selector
+# loop stays cooperative there because its select() goes through the patched
+# selectors module; uvloop is only installed when gevent isn't active.
+if not monkey.is_module_patched('socket'):
+    uvloop.install()
+LOOP = asyncio.new_event_loop()
+threading.Thread(target=LOOP.run_forever, daemon=True).start()
+
+# Redis response cache for idempotent GET endpoints
+redis_pool = redis.ConnectionPool.from_url(os.environ.get('REDIS_URL', 'redis://redis:6379/0'))
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+def cached(ttl=120):
+    """Cache a GET view's JSON response in Redis, keyed on path + query string"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = f"{request.path}:{request.query_string.decode()}"
+            try:
+                hit = redis_client.get(key)
+            except redis.RedisError:
+                hit = None
+            if hit is not None:
+                return Response(hit, mimetype='application/json')
+
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                try:
+                    redis_client.setex(key, ttl, response.get_data())
+                except redis.RedisError as e:
+                    logger.warning(f"Redis cache unavailable: {str(e)}")
+            return response
+        return wrapper
+    return decorator
+
+# Request models compiled once at import; validated straight from the raw body
+# by pydantic-core instead of get_json() + dict.get chains
+class PredictRequest(BaseModel):
+    symbol: str = Field(..., min_length=1)
+    days: int = 7
+    model: str = 'lstm'
+
+class ChatRequest(BaseModel):
+    message: str = Field(..., min_length=1)
+    sessionId: Optional[str] = None
+    context: Dict[str, Any] = Field(default_factory=dict)
+    history: List[Any] = Field(default_factory=list)
+
+class PortfolioItem(BaseModel):
+    symbol: str
+    value: float
+
+class PortfolioRequest(BaseModel):
+    portfolio: List[PortfolioItem] = Field(..., min_length=1)
+
+class RecommendationsRequest(BaseModel):
+    portfolio: List[PortfolioItem] = Field(default_factory=list)
+    risk_tolerance: str = 'moderate'
+
+# Shared executor for downstream fan-out inside request handlers
+app.executor = concurrent.futures.ThreadPoolExecutor(max_workers=32, thread_name_prefix='svc')
+
 # Initialize services
 stock_predictor = StockPredictor()
 enhanced_chatbot = EnhancedChatbot(stock_predictor=stock_predictor, data_dir="data")
-portfolio_analyzer = PortfolioAnalyzer(data_dir="data")
+portfolio_analyzer = PortfolioAnalyzer(data_dir="data", executor=app.executor)
+
+# /health is hit constantly by liveness probes; only the timestamp changes,
+# so the JSON envelope is pre-encoded and the timestamp spliced in
+HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+HEALTH_SUFFIX = b'","service":"AI Services","version":"1.0.0"}'
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'service': 'AI Services',
-        'version': '1.0.0'
-    })
+    return Response(HEALTH_PREFIX + datetime.now().isoformat().encode() + HEALTH_SUFFIX,
+                    mimetype='application/json')
 
 # Stock Prediction Routes
+_available_stocks_cache = {'expires': 0.0, 'body': b''}
+
 @app.route('/stocks/available', methods=['GET'])
+@cached(ttl=300)
 def get_available_stocks():
     """Get list of available stocks"""
     try:
-        stocks = stock_predictor.get_available_stocks()
-        return jsonify(stocks)
+        # Serve pre-encoded bytes; the stock list only changes on deploy
+        now = time.monotonic()
+        if now >= _available_stocks_cache['expires']:
+            _available_stocks_cache['body'] = orjson.dumps(stock_predictor.get_available_stocks())
+            _available_stocks_cache['expires'] = now + 300
+        return Response(_available_stocks_cache['body'], mimetype='application/json')
     except Exception as e:
         logger.error(f"Error getting available stocks: {str(e)}")
         return jsonify({'error': 'Failed to get available stocks'}), 500
@@ -47,21 +173,19 @@ def get_available_stocks():
 def predict_stock():
     """Predict stock prices"""
     try:
-        data = request.get_json()
-        symbol = data.get('symbol')
-        days = data.get('days', 7)
-        model = data.get('model', 'lstm')
-        
-        if not symbol:
-            return jsonify({'error': 'Symbol is required'}), 400
-        
-        prediction = stock_predictor.predict(symbol, days, model)
+        try:
+            req = PredictRequest.model_validate_json(request.get_data(cache=False))
+        except ValidationError as e:
+            return jsonify({'error': e.errors(include_url=False)}), 400
+
+        prediction = stock_predictor.predict(req.symbol, req.days, req.model)
         return jsonify(prediction)
     except Exception as e:
         logger.error(f"Error predicting stock: {str(e)}")
         return jsonify({'error': 'Failed to predict stock'}), 500
 
 @app.route('/history', methods=['GET'])
+@cached(ttl=120)
 def get_history():
     """Get historical stock data"""
     try:
@@ -78,6 +202,7 @@ def get_history():
         return jsonify({'error': 'Failed to get historical data'}), 500
 
 @app.route('/analysis/<symbol>', methods=['GET'])
+@cached(ttl=120)
 def analyze_stock(symbol):
     """Get comprehensive stock analysis"""
     try:
@@ -88,6 +213,7 @@ def analyze_stock(symbol):
         return jsonify({'error': 'Failed to analyze stock'}), 500
 
 @app.route('/sentiment/<symbol>', methods=['GET'])
+@cached(ttl=60)
 def get_sentiment(symbol):
     """Get market sentiment for stock"""
     try:
@@ -101,8 +227,12 @@ def get_sentiment(symbol):
 def get_recommendations():
     """Get portfolio recommendations"""
     try:
-        data = request.get_json()
-        recommendations = stock_predictor.get_recommendations(data)
+        try:
+            req = RecommendationsRequest.model_validate_json(request.get_data(cache=False))
+        except ValidationError as e:
+            return jsonify({'error': e.errors(include_url=False)}), 400
+
+        recommendations = stock_predictor.get_recommendations([item.model_dump() for item in req.portfolio])
         return jsonify(recommendations)
     except Exception as e:
         logger.error(f"Error getting recommendations: {str(e)}")
@@ -113,23 +243,17 @@ def get_recommendations():
 def chat():
     """Process chat message with enhanced chatbot"""
     try:
-        data = request.get_json()
-        message = data.get('message')
-        session_id = data.get('sessionId')
-        context = data.get('context', {})
-        history = data.get('history', [])
-        
-        if not message:
-            return jsonify({'error': 'Message is required'}), 400
-        
-        # Run async process_message in sync context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         try:
-            response = loop.run_until_complete(enhanced_chatbot.process_message(message, session_id, context, history))
-        finally:
-            loop.close()
-        
+            req = ChatRequest.model_validate_json(request.get_data(cache=False))
+        except ValidationError as e:
+            return jsonify({'error': e.errors(include_url=False)}), 400
+
+        # Dispatch async process_message to the shared background loop
+        future = asyncio.run_coroutine_threadsafe(
+            enhanced_chatbot.process_message(req.message, req.sessionId, req.context, req.history), LOOP
+        )
+        response = future.result(timeout=30)
+
         return jsonify(response)
     except Exception as e:
         logger.error(f"Error processing chat: {str(e)}")
@@ -153,18 +277,12 @@ def get_suggestions():
 def analyze_portfolio():
     """Analyze portfolio and assess risk"""
     try:
-        data = request.get_json()
-        portfolio_data = data.get('portfolio', [])
-        
-        if not portfolio_data:
-            return jsonify({'error': 'Portfolio data is required'}), 400
-        
-        # Validate portfolio data structure
-        for item in portfolio_data:
-            if 'symbol' not in item or 'value' not in item:
-                return jsonify({'error': 'Each portfolio item must have symbol and value'}), 400
-        
-        analysis = portfolio_analyzer.get_portfolio_analysis(portfolio_data)
+        try:
+            req = PortfolioRequest.model_validate_json(request.get_data(cache=False))
+        except ValidationError as e:
+            return jsonify({'error': e.errors(include_url=False)}), 400
+
+        analysis = portfolio_analyzer.get_portfolio_analysis([item.model_dump() for item in req.portfolio])
         return jsonify(analysis)
         
     except Exception as e:
@@ -175,11 +293,13 @@ def analyze_portfolio():
 def get_portfolio_recommendations():
     """Get stock recommendations for portfolio improvement"""
     try:
-        data = request.get_json()
-        portfolio_data = data.get('portfolio', [])
-        risk_tolerance = data.get('risk_tolerance', 'moderate')
-        
-        recommendations = portfolio_analyzer.get_stock_recommendations(portfolio_data, risk_tolerance)
+        try:
+            req = RecommendationsRequest.model_validate_json(request.get_data(cache=False))
+        except ValidationError as e:
+            return jsonify({'error': e.errors(include_url=False)}), 400
+
+        recommendations = portfolio_analyzer.get_stock_recommendations(
+            [item.model_dump() for item in req.portfolio], req.risk_tolerance)
         return jsonify(recommendations)
         
     except Exception as e:
@@ -187,6 +307,7 @@ def get_portfolio_recommendations():
         return jsonify({'error': 'Failed to get recommendations'}), 500
 
 @app.route('/portfolio/stock-info/<symbol>', methods=['GET'])
+@cached(ttl=300)
 def get_stock_info(symbol):
     """Get detailed stock information"""
     try:
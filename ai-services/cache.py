@@ -0,0 +1,46 @@
+import json
+import hashlib
+import os
+import time
+import logging
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+class FileCache:
+    """Persistent on-disk cache with per-entry TTL for upstream API responses"""
+
+    def __init__(self, cache_dir: str = "data/.cache"):
+        self.cache_dir = Path(cache_dir)
+
+    def _entry_path(self, endpoint: str, key: str) -> Path:
+        digest = hashlib.md5(key.encode()).hexdigest()
+        return self.cache_dir / endpoint / f"{digest}.json"
+
+    def get(self, endpoint: str, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        path = self._entry_path(endpoint, key)
+        try:
+            if not path.exists():
+                return None
+            wrapper = json.loads(path.read_text())
+            if time.time() - wrapper['ts'] > wrapper['ttl']:
+                return None
+            return wrapper['value']
+        except Exception as e:
+            logger.warning(f"Error reading cache entry {path}: {str(e)}")
+            return None
+
+    def set(self, endpoint: str, key: str, value: Any, ttl: float) -> None:
+        """Store a value with the given TTL in seconds"""
+        path = self._entry_path(endpoint, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Tempfile + atomic rename: a crash mid-write must not leave a
+            # truncated entry that would poison later reads
+            tmp = path.with_suffix('.tmp')
+            tmp.write_text(json.dumps({'ts': time.time(), 'ttl': ttl, 'value': value}, default=str))
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"Error writing cache entry {path}: {str(e)}")
@@ -4,25 +4,61 @@ Create Sample Data for Enhanced Chatbot
 This script creates sample data files for demonstration purposes
 """
 
-import json
+import orjson
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 import random
 
+import numpy as np
+import pandas as pd
+import xxhash
+
+# Date vectors built once per run and shared by every symbol/index, instead of
+# calling datetime.now()/strftime inside each comprehension
+DATES_30 = pd.date_range(end=datetime.now() - timedelta(days=1), periods=30).strftime('%Y-%m-%d').tolist()
+DATES_12M = pd.date_range(end=datetime.now() - timedelta(days=30), periods=12, freq='30D').strftime('%Y-%m-%d').tolist()
+
+# News templates built once at module scope; formatted per symbol on use
+NEWS_TEMPLATES = (
+    "{s} reports strong quarterly earnings, beating analyst expectations",
+    "New product launch from {s} shows promising market potential",
+    "{s} announces strategic partnership to expand market reach",
+    "Analysts upgrade {s} stock rating based on growth prospects",
+    "{s} demonstrates innovation leadership in latest technology showcase",
+    "Market analysts remain bullish on {s} despite market volatility",
+    "{s} expands into new markets with aggressive growth strategy",
+    "Investors show confidence in {s} management team decisions"
+)
+
+NEWS_DESCRIPTION = "Latest developments in {s} stock and company performance."
+NEWS_CONTENT = "Detailed analysis of {s} recent performance and future outlook."
+NEWS_SOURCES = ('Reuters', 'Bloomberg', 'CNBC', 'MarketWatch', 'Yahoo Finance')
+
 def create_sample_stock_data(symbol: str) -> dict:
     """Create sample stock data for a symbol"""
-    base_price = 100 + (hash(symbol) % 200)
-    current_price = base_price + random.uniform(-20, 20)
-    
+    # xxh3 is stable across processes (builtin hash() is randomized by
+    # PYTHONHASHSEED), so sample files are reproducible between runs
+    symbol_hash = xxhash.xxh3_64_intdigest(symbol)
+    rng = np.random.default_rng(symbol_hash & 0xFFFFFFFF)
+    base_price = 100 + (symbol_hash % 200)
+    current_price = base_price + rng.uniform(-20, 20)
+
+    # Draw every random series for the symbol in a few vectorized calls
+    closes = np.round(current_price + rng.uniform(-5, 5, 30), 2)
+    volumes = rng.integers(1000000, 5000001, 30)
+    rec_labels = rng.choice(['Buy', 'Hold', 'Sell'], 10)
+    rec_targets = np.round(current_price * rng.uniform(0.8, 1.3, 10), 2)
+
     return {
         'symbol': symbol,
         'company_info': {
             'longName': f'{symbol} Corporation',
             'shortName': symbol,
             'currentPrice': round(current_price, 2),
-            'marketCap': random.randint(1000000000, 5000000000),
-            'trailingPE': round(random.uniform(10, 50), 2),
+            'marketCap': int(rng.integers(1000000000, 5000000001)),
+            'trailingPE': round(rng.uniform(10, 50), 2),
             'fiftyTwoWeekLow': round(current_price * 0.7, 2),
             'fiftyTwoWeekHigh': round(current_price * 1.5, 2),
             'longBusinessSummary': f'{symbol} is a leading technology company that specializes in innovative solutions for the modern digital economy. The company has shown strong growth potential and maintains a solid market position.',
@@ -31,143 +67,114 @@ def create_sample_stock_data(symbol: str) -> dict:
             'website': f'https://www.{symbol.lower()}.com',
             'country': 'United States'
         },
-        'historical_data': [
-            {
-                'Date': (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d'),
-                'Close': round(current_price + random.uniform(-5, 5), 2),
-                'Volume': random.randint(1000000, 5000000)
-            } for i in range(30, 0, -1)
-        ],
+        # Columnar (SoA) layout: one array per column instead of 30 row dicts;
+        # orjson serializes the ndarrays directly and pd.DataFrame(columns)
+        # loads them without per-row conversion
+        'historical_data': {
+            'Date': DATES_30,
+            'Close': closes,
+            'Volume': volumes
+        },
         'financials': {
-            'revenue': random.randint(10000000000, 100000000000),
-            'net_income': random.randint(1000000000, 20000000000),
-            'total_assets': random.randint(50000000000, 200000000000)
+            'revenue': int(rng.integers(10000000000, 100000000001)),
+            'net_income': int(rng.integers(1000000000, 20000000001)),
+            'total_assets': int(rng.integers(50000000000, 200000000001))
         },
         'recommendations': [
             {
-                'date': (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d'),
-                'recommendation': random.choice(['Buy', 'Hold', 'Sell']),
-                'price_target': round(current_price * random.uniform(0.8, 1.3), 2)
-            } for i in range(10, 0, -1)
+                'date': date,
+                'recommendation': label,
+                'price_target': target
+            } for date, label, target in zip(DATES_30[-10:], rec_labels.tolist(), rec_targets.tolist())
         ],
         'collected_at': datetime.now().isoformat()
     }
 
 def create_sample_news_data(symbol: str) -> list:
     """Create sample news data for a symbol"""
-    news_templates = [
-        f"{symbol} reports strong quarterly earnings, beating analyst expectations",
-        f"New product launch from {symbol} shows promising market potential",
-        f"{symbol} announces strategic partnership to expand market reach",
-        f"Analysts upgrade {symbol} stock rating based on growth prospects",
-        f"{symbol} demonstrates innovation leadership in latest technology showcase",
-        f"Market analysts remain bullish on {symbol} despite market volatility",
-        f"{symbol} expands into new markets with aggressive growth strategy",
-        f"Investors show confidence in {symbol} management team decisions"
-    ]
-    
+    description = NEWS_DESCRIPTION.format(s=symbol)
+    content = NEWS_CONTENT.format(s=symbol)
+    url_prefix = f"https://example.com/news/{symbol.lower()}-"
+
     return [
         {
-            'title': random.choice(news_templates),
-            'description': f"Latest developments in {symbol} stock and company performance.",
-            'content': f"Detailed analysis of {symbol} recent performance and future outlook.",
-            'published_at': (datetime.now() - timedelta(days=random.randint(1, 30))).isoformat(),
-            'source': random.choice(['Reuters', 'Bloomberg', 'CNBC', 'MarketWatch', 'Yahoo Finance']),
-            'url': f"https://example.com/news/{symbol.lower()}-{i}",
+            'title': random.choice(NEWS_TEMPLATES).format(s=symbol),
+            'description': description,
+            'content': content,
+            'published_at': random.choice(DATES_30),
+            'source': random.choice(NEWS_SOURCES),
+            'url': url_prefix + str(i),
             'symbol': symbol
         } for i in range(random.randint(5, 15))
     ]
 
 def create_sample_market_data() -> dict:
     """Create sample market data"""
+    rng = np.random.default_rng()
+
+    def index_series(base: float, close_lo: float, close_hi: float, vol_lo: int, vol_hi: int) -> list:
+        # One vectorized draw per column instead of 30 scalar calls each
+        closes = np.round(base + rng.uniform(close_lo, close_hi, 30), 2)
+        volumes = rng.integers(vol_lo, vol_hi + 1, 30)
+        return [
+            {
+                'Date': date,
+                'Close': close,
+                'Volume': volume
+            } for date, close, volume in zip(DATES_30, closes.tolist(), volumes.tolist())
+        ]
+
     return {
         '^GSPC': {  # S&P 500
             'info': {
                 'longName': 'S&P 500',
-                'currentPrice': 4500 + random.uniform(-100, 100)
+                'currentPrice': 4500 + rng.uniform(-100, 100)
             },
-            'historical': [
-                {
-                    'Date': (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d'),
-                    'Close': 4500 + random.uniform(-50, 50),
-                    'Volume': random.randint(1000000000, 3000000000)
-                } for i in range(30, 0, -1)
-            ]
+            'historical': index_series(4500, -50, 50, 1000000000, 3000000000)
         },
         '^DJI': {  # Dow Jones
             'info': {
                 'longName': 'Dow Jones Industrial Average',
-                'currentPrice': 35000 + random.uniform(-500, 500)
+                'currentPrice': 35000 + rng.uniform(-500, 500)
             },
-            'historical': [
-                {
-                    'Date': (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d'),
-                    'Close': 35000 + random.uniform(-200, 200),
-                    'Volume': random.randint(500000000, 1500000000)
-                } for i in range(30, 0, -1)
-            ]
+            'historical': index_series(35000, -200, 200, 500000000, 1500000000)
         },
         '^IXIC': {  # NASDAQ
             'info': {
                 'longName': 'NASDAQ Composite',
-                'currentPrice': 14000 + random.uniform(-300, 300)
+                'currentPrice': 14000 + rng.uniform(-300, 300)
             },
-            'historical': [
-                {
-                    'Date': (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d'),
-                    'Close': 14000 + random.uniform(-150, 150),
-                    'Volume': random.randint(800000000, 2500000000)
-                } for i in range(30, 0, -1)
-            ]
+            'historical': index_series(14000, -150, 150, 800000000, 2500000000)
         },
         '^VIX': {  # VIX
             'info': {
                 'longName': 'CBOE Volatility Index',
-                'currentPrice': 15 + random.uniform(-5, 10)
+                'currentPrice': 15 + rng.uniform(-5, 10)
             },
-            'historical': [
-                {
-                    'Date': (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d'),
-                    'Close': 15 + random.uniform(-3, 8),
-                    'Volume': random.randint(100000, 500000)
-                } for i in range(30, 0, -1)
-            ]
+            'historical': index_series(15, -3, 8, 100000, 500000)
         }
     }
 
 def create_sample_economic_data() -> dict:
     """Create sample economic indicators"""
+    rng = np.random.default_rng()
+
+    # (center, spread) per series; each series drawn in one vectorized call
+    series = {
+        'GDP': (25000, 500),
+        'UNRATE': (3.5, 0.5),
+        'CPIAUCSL': (300, 10),
+        'FEDFUNDS': (5.25, 0.25),
+        'DGS10': (4.5, 0.5)
+    }
+
     return {
-        'GDP': [
-            {
-                'date': (datetime.now() - timedelta(days=i*30)).strftime('%Y-%m-%d'),
-                'value': 25000 + random.uniform(-500, 500)
-            } for i in range(12, 0, -1)
-        ],
-        'UNRATE': [
+        name: [
             {
-                'date': (datetime.now() - timedelta(days=i*30)).strftime('%Y-%m-%d'),
-                'value': 3.5 + random.uniform(-0.5, 0.5)
-            } for i in range(12, 0, -1)
-        ],
-        'CPIAUCSL': [
-            {
-                'date': (datetime.now() - timedelta(days=i*30)).strftime('%Y-%m-%d'),
-                'value': 300 + random.uniform(-10, 10)
-            } for i in range(12, 0, -1)
-        ],
-        'FEDFUNDS': [
-            {
-                'date': (datetime.now() - timedelta(days=i*30)).strftime('%Y-%m-%d'),
-                'value': 5.25 + random.uniform(-0.25, 0.25)
-            } for i in range(12, 0, -1)
-        ],
-        'DGS10': [
-            {
-                'date': (datetime.now() - timedelta(days=i*30)).strftime('%Y-%m-%d'),
-                'value': 4.5 + random.uniform(-0.5, 0.5)
-            } for i in range(12, 0, -1)
-        ]
+                'date': date,
+                'value': value
+            } for date, value in zip(DATES_12M, (center + rng.uniform(-spread, spread, 12)).tolist())
+        ] for name, (center, spread) in series.items()
     }
 
 def create_sample_prompt_templates() -> dict:
@@ -258,49 +265,37 @@ Provide a sentiment score (1-10) and detailed analysis of market sentiment.
         }
     }
 
+def write_json_file(path: Path, payload) -> None:
+    """Serialize a payload and write it to disk"""
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str))
+
 def main():
     """Create sample data for all directories"""
     data_dir = Path("data")
-    
+
     # Create directories
     for subdir in ['stocks', 'news', 'economic', 'prompts']:
         (data_dir / subdir).mkdir(parents=True, exist_ok=True)
-    
+
     symbols = ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'META', 'NVDA', 'NFLX', 'ADBE', 'CRM']
-    
+
     print("Creating sample data...")
-    
-    # Create stock data
+
+    # Collect (path, payload) pairs, then overlap the file writes
+    tasks = []
     for symbol in symbols:
-        stock_data = create_sample_stock_data(symbol)
-        with open(data_dir / "stocks" / f"{symbol}_data.json", 'w') as f:
-            json.dump(stock_data, f, indent=2, default=str)
-        print(f"Created stock data for {symbol}")
-    
-    # Create news data
+        tasks.append((data_dir / "stocks" / f"{symbol}_data.json", create_sample_stock_data(symbol)))
     for symbol in symbols:
-        news_data = create_sample_news_data(symbol)
-        with open(data_dir / "news" / f"{symbol}_news.json", 'w') as f:
-            json.dump(news_data, f, indent=2, default=str)
-        print(f"Created news data for {symbol}")
-    
-    # Create market data
-    market_data = create_sample_market_data()
-    with open(data_dir / "economic" / "market_data.json", 'w') as f:
-        json.dump(market_data, f, indent=2, default=str)
-    print("Created market data")
-    
-    # Create economic data
-    economic_data = create_sample_economic_data()
-    with open(data_dir / "economic" / "economic_indicators.json", 'w') as f:
-        json.dump(economic_data, f, indent=2, default=str)
-    print("Created economic data")
-    
-    # Create prompt templates
-    prompt_templates = create_sample_prompt_templates()
-    with open(data_dir / "prompts" / "templates.json", 'w') as f:
-        json.dump(prompt_templates, f, indent=2, default=str)
-    print("Created prompt templates")
+        tasks.append((data_dir / "news" / f"{symbol}_news.json", create_sample_news_data(symbol)))
+    tasks.append((data_dir / "economic" / "market_data.json", create_sample_market_data()))
+    tasks.append((data_dir / "economic" / "economic_indicators.json", create_sample_economic_data()))
+    tasks.append((data_dir / "prompts" / "templates.json", create_sample_prompt_templates()))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda task: write_json_file(*task), tasks))
+
+    for path, _ in tasks:
+        print(f"Created {path.name}")
     
     print("\nSample data creation completed!")
     print("You can now use the enhanced chatbot with comprehensive sample data.")
@@ -1,65 +1,262 @@
 import os
-import json
+import orjson
+import asyncio
+import aiohttp
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 import logging
 from typing import Dict, List, Optional
 import yfinance as yf
+import zstandard
+from pyarrow import feather
+
+from cache import FileCache
 
 logger = logging.getLogger(__name__)
 
+# API keys read once at import instead of per-construction
+ALPHA_VANTAGE_KEY = os.getenv('ALPHA_VANTAGE_KEY')
+NEWS_API_KEY = os.getenv('NEWS_API_KEY')
+FINNHUB_KEY = os.getenv('FINNHUB_KEY')
+
+# Prompt templates are a pure constant; built once at import instead of
+# re-allocated (and re-written to disk) on every collection run
+_PROMPT_TEMPLATES = {
+    'stock_analysis': {
+        'context': "You are a financial analyst assistant. Use the following data to provide insights:",
+        'data_sources': ['stock_data', 'news_data', 'market_data', 'economic_data'],
+        'prompt_template': """
+Based on the following data for {symbol}:
+
+**Stock Data:**
+- Current Price: ${current_price}
+- 52-Week Range: ${low_52wk} - ${high_52wk}
+- Market Cap: ${market_cap}
+- P/E Ratio: {pe_ratio}
+
+**Recent News Sentiment:**
+{news_summary}
+
+**Market Context:**
+- S&P 500: {sp500_change}%
+- Market Volatility (VIX): {vix_value}
+
+**Economic Indicators:**
+- Interest Rate: {interest_rate}%
+- Inflation Rate: {inflation_rate}%
+
+Provide a comprehensive analysis including:
+1. Technical analysis
+2. Fundamental analysis
+3. Risk assessment
+4. Investment recommendation
+""",
+        'variables': ['symbol', 'current_price', 'low_52wk', 'high_52wk', 'market_cap', 'pe_ratio', 'news_summary', 'sp500_change', 'vix_value', 'interest_rate', 'inflation_rate']
+    },
+    
+    'prediction_prompt': {
+        'context': "You are an AI stock prediction model. Analyze the following data:",
+        'data_sources': ['historical_data', 'technical_indicators', 'sentiment_data'],
+        'prompt_template': """
+Given the following data for {symbol}:
+
+**Historical Performance:**
+- 30-day return: {return_30d}%
+- 90-day return: {return_90d}%
+- Volatility: {volatility}%
+
+**Technical Indicators:**
+- RSI: {rsi}
+- MACD: {macd}
+- Moving Averages: {ma_status}
+
+**Market Sentiment:**
+- News Sentiment: {news_sentiment}
+- Analyst Recommendations: {analyst_recs}
+
+**Market Conditions:**
+- Sector Performance: {sector_performance}%
+- Market Trend: {market_trend}
+
+Predict the stock price for the next 7 days with confidence level and reasoning.
+""",
+        'variables': ['symbol', 'return_30d', 'return_90d', 'volatility', 'rsi', 'macd', 'ma_status', 'news_sentiment', 'analyst_recs', 'sector_performance', 'market_trend']
+    },
+    
+    'sentiment_analysis': {
+        'context': "You are a market sentiment analyst. Analyze the following news and social media data:",
+        'data_sources': ['news_data', 'social_media', 'analyst_reports'],
+        'prompt_template': """
+Analyze the sentiment for {symbol} based on:
+
+**Recent News Articles ({news_count} articles):**
+{news_summary}
+
+**Social Media Mentions:**
+- Twitter Sentiment: {twitter_sentiment}
+- Reddit Sentiment: {reddit_sentiment}
+
+**Analyst Coverage:**
+- Buy Recommendations: {buy_count}
+- Hold Recommendations: {hold_count}
+- Sell Recommendations: {sell_count}
+
+Provide a sentiment score (1-10) and detailed analysis of market sentiment.
+""",
+        'variables': ['symbol', 'news_count', 'news_summary', 'twitter_sentiment', 'reddit_sentiment', 'buy_count', 'hold_count', 'sell_count']
+    }
+}
+
 class DataCollector:
     def __init__(self, data_dir: str = "data"):
         self.data_dir = data_dir
         self.ensure_data_dir()
         
         # API Keys (set these in environment variables)
-        self.alpha_vantage_key = os.getenv('ALPHA_VANTAGE_KEY')
-        self.news_api_key = os.getenv('NEWS_API_KEY')
-        self.finnhub_key = os.getenv('FINNHUB_KEY')
-        
+        self.alpha_vantage_key = ALPHA_VANTAGE_KEY
+        self.news_api_key = NEWS_API_KEY
+        self.finnhub_key = FINNHUB_KEY
+
+        # Pool for bridging blocking yfinance calls into the asyncio fan-out
+        self.executor = ThreadPoolExecutor(max_workers=16)
+
+        # TTL'd file cache so warm runs skip upstream APIs entirely
+        self.cache = FileCache(f"{self.data_dir}/.cache")
+
+        # Pooled session: keep-alive across calls plus retry/backoff for 429s
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                              max_retries=Retry(total=3, backoff_factor=0.5,
+                                                status_forcelist=[429, 500, 502, 503, 504]))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def ensure_data_dir(self):
         """Ensure data directory exists"""
-        os.makedirs(self.data_dir, exist_ok=True)
-        os.makedirs(f"{self.data_dir}/stocks", exist_ok=True)
-        os.makedirs(f"{self.data_dir}/news", exist_ok=True)
-        os.makedirs(f"{self.data_dir}/sentiment", exist_ok=True)
-        os.makedirs(f"{self.data_dir}/economic", exist_ok=True)
-        os.makedirs(f"{self.data_dir}/prompts", exist_ok=True)
+        # Class-level flag: repeated constructions (tests, worker fan-out)
+        # skip the five mkdir syscalls after the first instance
+        if getattr(DataCollector, '_dirs_ready', False):
+            return
+        for subdir in ('stocks', 'news', 'sentiment', 'economic', 'prompts'):
+            Path(f"{self.data_dir}/{subdir}").mkdir(parents=True, exist_ok=True)
+        DataCollector._dirs_ready = True
     
-    def collect_stock_data(self, symbol: str, period: str = "1y") -> Dict:
+    @staticmethod
+    def _write_compressed_json(file_path: str, payload, option: int = 0) -> None:
+        """Serialize a payload and write it zstd-compressed (5-10x smaller on
+        these highly redundant blobs, near-zero CPU cost at level 3)"""
+        # One compressor per call: ZstdCompressor instances aren't safe to
+        # share across the executor threads collecting symbols concurrently
+        # Write to a sibling tempfile and rename: os.replace is atomic, so a
+        # crash mid-write can never leave a truncated blob at the final path
+        compressor = zstandard.ZstdCompressor(level=3)
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            f.write(compressor.compress(orjson.dumps(payload, option=option)))
+        os.replace(tmp_path, file_path)
+
+    @staticmethod
+    def _frame_to_columns(df: Optional[pd.DataFrame]) -> Dict:
+        """Convert a dataframe to a columnar dict via pandas' C JSON writer,
+        avoiding per-cell Python object boxing from DataFrame.to_dict()"""
+        if df is None or df.empty:
+            return {}
+        return orjson.loads(df.to_json(orient='columns', date_format='iso'))
+
+    def collect_histories_bulk(self, symbols: List[str], period: str = "1y") -> Dict[str, pd.DataFrame]:
+        """Download price history for all symbols in one batched request"""
+        try:
+            hist_all = yf.download(' '.join(symbols), period=period, group_by='ticker',
+                                   threads=True, progress=False)
+            if len(symbols) == 1:
+                return {symbols[0]: hist_all}
+            return {symbol: hist_all[symbol].dropna(how='all') for symbol in symbols}
+        except Exception as e:
+            logger.error(f"Error bulk-downloading histories: {str(e)}")
+            return {}
+
+    def collect_stock_data(self, symbol: str, period: str = "1y", force_refresh: bool = False,
+                           hist: Optional[pd.DataFrame] = None) -> Dict:
         """Collect comprehensive stock data"""
         try:
-            # Use yfinance for basic data
+            # Prices change daily at best; serve warm runs from the file cache
+            cache_key = f"{symbol}:{period}"
+            if not force_refresh:
+                cached = self.cache.get('stocks', cache_key)
+                if cached is not None:
+                    return cached
+
+            # Use yfinance for basic data (history may come pre-fetched from
+            # the bulk download)
             ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period)
-            
-            # Get company info
-            info = ticker.info
-            
-            # Get financials
-            financials = ticker.financials
-            balance_sheet = ticker.balance_sheet
-            
-            # Get analyst recommendations
-            recommendations = ticker.recommendations
+            if hist is None:
+                hist = ticker.history(period=period)
+
+            # The four yfinance property reads each trigger an independent
+            # Yahoo request; a local pool runs them concurrently so the
+            # per-symbol latency is max-of-four instead of sum-of-four.
+            # (Local pool, not self.executor: this method already runs on
+            # executor threads during the fan-out and re-submitting to the
+            # same saturated pool could deadlock.)
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                fast_future = pool.submit(lambda: ticker.fast_info)
+                financials_future = pool.submit(lambda: ticker.financials)
+                balance_sheet_future = pool.submit(lambda: ticker.balance_sheet)
+                recommendations_future = pool.submit(lambda: ticker.recommendations)
+
+                # fast_info hits yfinance's lightweight quote endpoint
+                # (~50ms) instead of the full ~150-key info scrape (~1-2s);
+                # only the fields the prompt templates reference are kept
+                fast = fast_future.result()
+                info = {
+                    'current_price': fast['last_price'],
+                    'low_52wk': fast['year_low'],
+                    'high_52wk': fast['year_high'],
+                    'market_cap': fast['market_cap'],
+                    'shares': fast['shares']
+                }
+
+                financials = financials_future.result()
+                balance_sheet = balance_sheet_future.result()
+                recommendations = recommendations_future.result()
+
+            # P/E derived from the income statement rather than the slow
+            # info scrape
+            try:
+                net_income = financials.loc['Net Income'].iloc[0]
+                eps = net_income / info['shares'] if info['shares'] else None
+                info['pe_ratio'] = round(info['current_price'] / eps, 2) if eps else None
+            except Exception:
+                info['pe_ratio'] = None
             
+            # Historical prices live in a columnar Parquet sibling; the JSON
+            # blob keeps only scalar metadata
+            hist_path = f"{self.data_dir}/stocks/{symbol}_hist.parquet"
+            hist.to_parquet(hist_path, compression='zstd')
+
             data = {
                 'symbol': symbol,
-                'historical_data': hist.to_dict('records'),
+                'historical_data_file': hist_path,
                 'company_info': info,
-                'financials': financials.to_dict() if financials is not None else {},
-                'balance_sheet': balance_sheet.to_dict() if balance_sheet is not None else {},
-                'recommendations': recommendations.to_dict() if recommendations is not None else {},
+                'financials': self._frame_to_columns(financials),
+                'balance_sheet': self._frame_to_columns(balance_sheet),
+                'recommendations': self._frame_to_columns(recommendations),
                 'collected_at': datetime.now().isoformat()
             }
             
             # Save to file
-            file_path = f"{self.data_dir}/stocks/{symbol}_data.json"
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            file_path = f"{self.data_dir}/stocks/{symbol}_data.json.zst"
+            self._write_compressed_json(file_path, data,
+                                        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
             
+            self.cache.set('stocks', cache_key, data, ttl=86400)
+
             logger.info(f"Collected stock data for {symbol}")
             return data
             
@@ -67,11 +264,18 @@ class DataCollector:
             logger.error(f"Error collecting stock data for {symbol}: {str(e)}")
             return {}
     
-    def collect_news_data(self, symbol: str, days: int = 30) -> List[Dict]:
+    async def collect_news_data(self, session: aiohttp.ClientSession, symbol: str, days: int = 30,
+                                force_refresh: bool = False) -> List[Dict]:
         """Collect news articles for sentiment analysis"""
         news_data = []
-        
+
         try:
+            cache_key = f"{symbol}:{days}"
+            if not force_refresh:
+                cached = self.cache.get('news', cache_key)
+                if cached is not None:
+                    return cached
+
             # Use NewsAPI if available
             if self.news_api_key:
                 url = f"https://newsapi.org/v2/everything"
@@ -80,29 +284,55 @@ class DataCollector:
                     'from': (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d'),
                     'sortBy': 'publishedAt',
                     'apiKey': self.news_api_key,
-                    'language': 'en'
+                    'language': 'en',
+                    'pageSize': 100
                 }
-                
-                response = requests.get(url, params=params)
-                if response.status_code == 200:
-                    articles = response.json().get('articles', [])
-                    for article in articles:
-                        news_data.append({
-                            'title': article.get('title'),
-                            'description': article.get('description'),
-                            'content': article.get('content'),
-                            'published_at': article.get('publishedAt'),
-                            'source': article.get('source', {}).get('name'),
-                            'url': article.get('url'),
-                            'symbol': symbol
-                        })
-            
-            # Save news data
+
+                async def fetch_page(page: int):
+                    async with session.get(url, params={**params, 'page': page}) as response:
+                        if response.status != 200:
+                            return 0, []
+                        payload = await response.json()
+                        return payload.get('totalResults', 0), payload.get('articles', [])
+
+                # Page 1 reveals totalResults; the remaining pages are
+                # fetched concurrently instead of silently capping at one
+                # page of results
+                total_results, articles = await fetch_page(1)
+                pages = min(-(-total_results // 100), 5)
+                if pages > 1:
+                    for _, extra in await asyncio.gather(*(fetch_page(page)
+                                                           for page in range(2, pages + 1))):
+                        articles.extend(extra)
+
+                for article in articles:
+                    news_data.append({
+                        'title': article.get('title'),
+                        'description': article.get('description'),
+                        'content': article.get('content'),
+                        'published_at': article.get('publishedAt'),
+                        'source': article.get('source', {}).get('name'),
+                        'url': article.get('url'),
+                        'symbol': symbol
+                    })
+
+            # Save news data as newline-delimited JSON: one encode per
+            # article streamed through the compressor, so readers can scan
+            # line by line without parsing one giant array
             if news_data:
-                file_path = f"{self.data_dir}/news/{symbol}_news.json"
-                with open(file_path, 'w') as f:
-                    json.dump(news_data, f, indent=2, default=str)
+                file_path = f"{self.data_dir}/news/{symbol}_news.jsonl.zst"
+                tmp_path = f"{file_path}.tmp"
+                compressor = zstandard.ZstdCompressor(level=3)
+                with open(tmp_path, 'wb', buffering=1 << 20) as f, \
+                        compressor.stream_writer(f) as writer:
+                    for article in news_data:
+                        writer.write(orjson.dumps(article, option=orjson.OPT_NAIVE_UTC) + b'\n')
+                # Atomic rename so a crash mid-stream never leaves a
+                # truncated file at the final path
+                os.replace(tmp_path, file_path)
                 
+                self.cache.set('news', cache_key, news_data, ttl=6 * 3600)
+
                 logger.info(f"Collected {len(news_data)} news articles for {symbol}")
             
         except Exception as e:
@@ -116,22 +346,36 @@ class DataCollector:
             # Major indices
             indices = ['^GSPC', '^DJI', '^IXIC', '^VIX']  # S&P 500, Dow, NASDAQ, VIX
             market_data = {}
-            
-            for index in indices:
-                ticker = yf.Ticker(index)
-                hist = ticker.history(period="1mo")
-                info = ticker.info
-                
+
+            # One batched download for all index histories instead of a
+            # request per index; info endpoints aren't batchable, so those
+            # are fetched concurrently
+            hist_all = yf.download(' '.join(indices), period="1mo", group_by='ticker',
+                                   threads=True, progress=False)
+            # Unbox numpy scalars up front so orjson never falls back to a
+            # per-value Python default callback
+            infos = list(self.executor.map(
+                lambda index: {k: v.item() if hasattr(v, 'item') else v
+                               for k, v in yf.Ticker(index).info.items()},
+                indices))
+
+            for index, info in zip(indices, infos):
+                hist = hist_all[index]
+                hist_path = f"{self.data_dir}/economic/{index}_hist.feather"
+                feather.write_feather(hist.reset_index(), hist_path)
                 market_data[index] = {
-                    'historical': hist.to_dict('records'),
+                    'historical_file': hist_path,
                     'info': info,
-                    'current_value': hist['Close'].iloc[-1] if not hist.empty else None
+                    'current_value': hist['Close'].iloc[-1] if not hist.empty else None,
+                    # Day-over-day change is all the chatbot needs from the
+                    # history, so the scalar rides along with the blob
+                    'prev_value': hist['Close'].iloc[-2] if len(hist) >= 2 else None
                 }
             
             # Save market data
-            file_path = f"{self.data_dir}/economic/market_data.json"
-            with open(file_path, 'w') as f:
-                json.dump(market_data, f, indent=2, default=str)
+            file_path = f"{self.data_dir}/economic/market_data.json.zst"
+            self._write_compressed_json(file_path, market_data,
+                                        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
             
             logger.info("Collected market data")
             return market_data
@@ -140,6 +384,27 @@ class DataCollector:
             logger.error(f"Error collecting market data: {str(e)}")
             return {}
     
+    def _fetch_fred_series(self, series_id: str, fred_api_key: str) -> Optional[List[Dict]]:
+        """Fetch one FRED series (cache-aware), returning its observations"""
+        cached = self.cache.get('fred', series_id)
+        if cached is not None:
+            return cached
+
+        url = f"https://api.stlouisfed.org/fred/series/observations"
+        params = {
+            'series_id': series_id,
+            'api_key': fred_api_key,
+            'file_type': 'json',
+            'limit': 100
+        }
+
+        response = self.session.get(url, params=params, timeout=10)
+        if response.status_code == 200:
+            observations = response.json().get('observations', [])
+            self.cache.set('fred', series_id, observations, ttl=86400)
+            return observations
+        return None
+
     def collect_economic_data(self) -> Dict:
         """Collect economic indicators"""
         try:
@@ -154,25 +419,20 @@ class DataCollector:
                     'DGS10': 'DGS10',  # 10-Year Treasury Rate
                 }
                 
+                # Fetch all series concurrently so the loop costs one RTT
+                # instead of N serial round-trips
+                futures = {name: self.executor.submit(self._fetch_fred_series, series_id, fred_api_key)
+                           for name, series_id in indicators.items()}
+
                 economic_data = {}
-                for name, series_id in indicators.items():
-                    url = f"https://api.stlouisfed.org/fred/series/observations"
-                    params = {
-                        'series_id': series_id,
-                        'api_key': fred_api_key,
-                        'file_type': 'json',
-                        'limit': 100
-                    }
-                    
-                    response = requests.get(url, params=params)
-                    if response.status_code == 200:
-                        data = response.json()
-                        economic_data[name] = data.get('observations', [])
+                for name, future in futures.items():
+                    observations = future.result()
+                    if observations is not None:
+                        economic_data[name] = observations
                 
                 # Save economic data
-                file_path = f"{self.data_dir}/economic/economic_indicators.json"
-                with open(file_path, 'w') as f:
-                    json.dump(economic_data, f, indent=2, default=str)
+                file_path = f"{self.data_dir}/economic/economic_indicators.json.zst"
+                self._write_compressed_json(file_path, economic_data, option=orjson.OPT_NAIVE_UTC)
                 
                 logger.info("Collected economic data")
                 return economic_data
@@ -182,130 +442,82 @@ class DataCollector:
         
         return {}
     
-    def generate_prompt_templates(self) -> Dict:
-        """Generate prompt templates based on collected data"""
-        templates = {
-            'stock_analysis': {
-                'context': "You are a financial analyst assistant. Use the following data to provide insights:",
-                'data_sources': ['stock_data', 'news_data', 'market_data', 'economic_data'],
-                'prompt_template': """
-Based on the following data for {symbol}:
-
-**Stock Data:**
-- Current Price: ${current_price}
-- 52-Week Range: ${low_52wk} - ${high_52wk}
-- Market Cap: ${market_cap}
-- P/E Ratio: {pe_ratio}
-
-**Recent News Sentiment:**
-{news_summary}
-
-**Market Context:**
-- S&P 500: {sp500_change}%
-- Market Volatility (VIX): {vix_value}
-
-**Economic Indicators:**
-- Interest Rate: {interest_rate}%
-- Inflation Rate: {inflation_rate}%
+    def generate_prompt_templates(self, force: bool = False) -> Dict:
+        """Write the static prompt templates if they aren't on disk yet"""
+        # The templates are a constant; skip the disk write on warm runs so
+        # this never costs anything inside a parallel fan-out
+        file_path = f"{self.data_dir}/prompts/templates.json"
+        if not force and os.path.exists(file_path):
+            return _PROMPT_TEMPLATES
 
-Provide a comprehensive analysis including:
-1. Technical analysis
-2. Fundamental analysis
-3. Risk assessment
-4. Investment recommendation
-""",
-                'variables': ['symbol', 'current_price', 'low_52wk', 'high_52wk', 'market_cap', 'pe_ratio', 'news_summary', 'sp500_change', 'vix_value', 'interest_rate', 'inflation_rate']
-            },
-            
-            'prediction_prompt': {
-                'context': "You are an AI stock prediction model. Analyze the following data:",
-                'data_sources': ['historical_data', 'technical_indicators', 'sentiment_data'],
-                'prompt_template': """
-Given the following data for {symbol}:
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            f.write(orjson.dumps(_PROMPT_TEMPLATES, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, file_path)
 
-**Historical Performance:**
-- 30-day return: {return_30d}%
-- 90-day return: {return_90d}%
-- Volatility: {volatility}%
+        logger.info("Generated prompt templates")
+        return _PROMPT_TEMPLATES
 
-**Technical Indicators:**
-- RSI: {rsi}
-- MACD: {macd}
-- Moving Averages: {ma_status}
+    async def _collect_symbol(self, session: aiohttp.ClientSession, symbol: str,
+                              semaphore: asyncio.Semaphore,
+                              hist: Optional[pd.DataFrame] = None):
+        """Collect stock and news data for one symbol (bounded by semaphore)"""
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                loop.run_in_executor(self.executor, self.collect_stock_data,
+                                     symbol, "1y", False, hist),
+                self.collect_news_data(session, symbol)
+            )
 
-**Market Sentiment:**
-- News Sentiment: {news_sentiment}
-- Analyst Recommendations: {analyst_recs}
+    async def collect_all_data_async(self, symbols: List[str] = None):
+        """Collect all types of data, fanning out across symbols"""
+        if symbols is None:
+            symbols = ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'META', 'NVDA']
 
-**Market Conditions:**
-- Sector Performance: {sector_performance}%
-- Market Trend: {market_trend}
+        logger.info(f"Starting data collection for {len(symbols)} symbols")
 
-Predict the stock price for the next 7 days with confidence level and reasoning.
-""",
-                'variables': ['symbol', 'return_30d', 'return_90d', 'volatility', 'rsi', 'macd', 'ma_status', 'news_sentiment', 'analyst_recs', 'sector_performance', 'market_trend']
-            },
-            
-            'sentiment_analysis': {
-                'context': "You are a market sentiment analyst. Analyze the following news and social media data:",
-                'data_sources': ['news_data', 'social_media', 'analyst_reports'],
-                'prompt_template': """
-Analyze the sentiment for {symbol} based on:
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(8)
 
-**Recent News Articles ({news_count} articles):**
-{news_summary}
+        # Batch all price histories in a single Yahoo request up front
+        histories = await loop.run_in_executor(self.executor, self.collect_histories_bulk, symbols)
 
-**Social Media Mentions:**
-- Twitter Sentiment: {twitter_sentiment}
-- Reddit Sentiment: {reddit_sentiment}
+        # One session so every request shares the TCP/TLS connection pool
+        async with aiohttp.ClientSession() as session:
+            # Collect stock and news data for all symbols concurrently
+            await asyncio.gather(*(self._collect_symbol(session, symbol, semaphore,
+                                                        histories.get(symbol))
+                                   for symbol in symbols))
 
-**Analyst Coverage:**
-- Buy Recommendations: {buy_count}
-- Hold Recommendations: {hold_count}
-- Sell Recommendations: {sell_count}
+            # Collect market and economic data
+            await asyncio.gather(
+                loop.run_in_executor(self.executor, self.collect_market_data),
+                loop.run_in_executor(self.executor, self.collect_economic_data)
+            )
 
-Provide a sentiment score (1-10) and detailed analysis of market sentiment.
-""",
-                'variables': ['symbol', 'news_count', 'news_summary', 'twitter_sentiment', 'reddit_sentiment', 'buy_count', 'hold_count', 'sell_count']
-            }
-        }
-        
-        # Save prompt templates
-        file_path = f"{self.data_dir}/prompts/templates.json"
-        with open(file_path, 'w') as f:
-            json.dump(templates, f, indent=2)
-        
-        logger.info("Generated prompt templates")
-        return templates
-    
-    def collect_all_data(self, symbols: List[str] = None):
-        """Collect all types of data"""
-        if symbols is None:
-            symbols = ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'META', 'NVDA']
-        
-        logger.info(f"Starting data collection for {len(symbols)} symbols")
-        
-        # Collect stock data
-        for symbol in symbols:
-            self.collect_stock_data(symbol)
-            self.collect_news_data(symbol)
-        
-        # Collect market and economic data
-        self.collect_market_data()
-        self.collect_economic_data()
-        
         # Generate prompt templates
         self.generate_prompt_templates()
-        
+
         logger.info("Data collection completed")
 
+    def collect_all_data(self, symbols: List[str] = None):
+        """Collect all types of data (sync entry point)"""
+        asyncio.run(self.collect_all_data_async(symbols))
+
+@lru_cache(maxsize=1)
+def get_default_collector() -> DataCollector:
+    """Lazily construct the shared DataCollector so every entry point reuses
+    one session pool, executor and file cache"""
+    return DataCollector()
+
 if __name__ == "__main__":
     # Set up logging
     logging.basicConfig(level=logging.INFO)
-    
+
     # Initialize collector
-    collector = DataCollector()
-    
+    collector = get_default_collector()
+
     # Collect data for major stocks
     symbols = ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'META', 'NVDA', 'NFLX', 'ADBE', 'CRM']
     collector.collect_all_data(symbols) 
\ No newline at end of file
@@ -0,0 +1,14 @@
+"""Gunicorn configuration for the compute-heavy pool
+
+/predict, /portfolio/analyze and /portfolio/risk-metrics run CPU-bound
+model/analyzer code that would stall a gevent loop, so the gateway routes
+them to this gthread pool instead.
+"""
+
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+
+worker_class = "gthread"
+workers = multiprocessing.cpu_count()
+threads = 4
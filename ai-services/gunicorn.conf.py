@@ -0,0 +1,15 @@
+"""Gunicorn configuration for the AI services API"""
+
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+
+# Async gevent workers: routes are I/O-bound, so one worker can multiplex
+# many in-flight requests while downstream sockets block
+worker_class = "gevent"
+worker_connections = 1000
+workers = multiprocessing.cpu_count() * 2 + 1
+
+# app.py gates monkey.patch_all() on this so the gthread compute pool,
+# which loads the same module, stays unpatched
+raw_env = ["GEVENT_WORKERS=1"]
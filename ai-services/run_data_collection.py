@@ -12,7 +12,7 @@ from pathlib import Path
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from data_collector import DataCollector
+from data_collector import get_default_collector
 
 def main():
     # Set up logging
@@ -24,8 +24,9 @@ def main():
     
     logger.info("Starting data collection for enhanced chatbot...")
     
-    # Initialize collector
-    collector = DataCollector()
+    # Shared module-level collector: one session pool and file cache even if
+    # other pipeline stages import it too
+    collector = get_default_collector()
     
     # Define symbols to collect data for
     symbols = [
@@ -0,0 +1,132 @@
+"""Fused nopython technical-indicator kernels shared by the services.
+
+The pandas rolling/ewm pipeline walks the Close series once per indicator;
+these kernels compute all of them in a handful of sequential passes with
+running sums, matching pandas semantics (NaN warm-up heads, ddof=1 rolling
+std, adjust=True exponential means).
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _rolling_mean(x, start, window, out):
+    """Running-sum rolling mean of x[start:]; NaN before the window fills"""
+    acc = 0.0
+    for i in range(start, x.shape[0]):
+        acc += x[i]
+        if i - start >= window:
+            acc -= x[i - window]
+        if i - start >= window - 1:
+            out[i] = acc / window
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _rolling_std(x, start, window, out):
+    """Rolling sample std (ddof=1) of x[start:] via running sum/sum-of-squares"""
+    acc = 0.0
+    acc2 = 0.0
+    for i in range(start, x.shape[0]):
+        acc += x[i]
+        acc2 += x[i] * x[i]
+        if i - start >= window:
+            acc -= x[i - window]
+            acc2 -= x[i - window] * x[i - window]
+        if i - start >= window - 1:
+            var = (acc2 - acc * acc / window) / (window - 1)
+            out[i] = np.sqrt(var) if var > 0.0 else 0.0
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _ewm_mean(x, span, out):
+    """Exponential mean matching pandas ewm(span=...).mean() with adjust=True"""
+    omb = 1.0 - 2.0 / (span + 1.0)
+    num = 0.0
+    den = 0.0
+    for i in range(x.shape[0]):
+        num = x[i] + omb * num
+        den = 1.0 + omb * den
+        out[i] = num / den
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def compute_all(close):
+    """Compute SMA 20/50, RSI(14), MACD(12,26), Bollinger(20) and 20-day
+    annualized volatility over a Close series in fused sequential passes.
+
+    Returns (sma_20, sma_50, rsi, macd, bb_middle, bb_upper, bb_lower,
+    volatility); warm-up heads are NaN as the pandas equivalents would be.
+    """
+    n = close.shape[0]
+    nan = np.nan
+
+    sma_20 = np.full(n, nan)
+    sma_50 = np.full(n, nan)
+    rsi = np.full(n, nan)
+    bb_middle = np.full(n, nan)
+    bb_upper = np.full(n, nan)
+    bb_lower = np.full(n, nan)
+    volatility = np.full(n, nan)
+
+    _rolling_mean(close, 0, 50, sma_50)
+
+    # One 20-day pass over Close carries the running sum and
+    # sum-of-squares together: SMA_20 and the Bollinger middle band are
+    # the same mean, and the band std reuses the shared registers
+    acc = 0.0
+    acc2 = 0.0
+    for i in range(n):
+        x = close[i]
+        acc += x
+        acc2 += x * x
+        if i >= 20:
+            y = close[i - 20]
+            acc -= y
+            acc2 -= y * y
+        if i >= 19:
+            m = acc / 20.0
+            var = (acc2 - acc * acc / 20.0) / 19.0
+            s = np.sqrt(var) if var > 0.0 else 0.0
+            sma_20[i] = m
+            bb_middle[i] = m
+            bb_upper[i] = m + 2.0 * s
+            bb_lower[i] = m - 2.0 * s
+
+    # Simple returns feed the rolling volatility; first element has no
+    # predecessor so the window starts at index 1 like pct_change()
+    returns = np.full(n, nan)
+    for i in range(1, n):
+        returns[i] = close[i] / close[i - 1] - 1.0
+    _rolling_std(returns, 1, 20, volatility)
+    for i in range(n):
+        volatility[i] *= np.sqrt(252.0)
+
+    # RSI: 14-day average gains/losses as cumulative-sum differences, so
+    # each window mean is two lookups instead of a fresh 14-element sum
+    deltas = np.diff(close)
+    gains = np.where(deltas > 0.0, deltas, 0.0)
+    losses = np.where(deltas < 0.0, -deltas, 0.0)
+    cg = np.zeros(n)
+    cl = np.zeros(n)
+    cg[1:] = np.cumsum(gains)
+    cl[1:] = np.cumsum(losses)
+    for i in range(14, n):
+        avg_gain = (cg[i] - cg[i - 14]) / 14.0
+        avg_loss = (cl[i] - cl[i - 14]) / 14.0
+        rs = avg_gain / avg_loss
+        rsi[i] = 100.0 - 100.0 / (1.0 + rs)
+
+    # MACD: difference of the 12- and 26-span exponential means
+    exp12 = np.empty(n)
+    exp26 = np.empty(n)
+    _ewm_mean(close, 12.0, exp12)
+    _ewm_mean(close, 26.0, exp26)
+    macd = exp12 - exp26
+
+    return sma_20, sma_50, rsi, macd, bb_middle, bb_upper, bb_lower, volatility
+
+
+# Pre-warm at import so the first analysis request doesn't pay compile
+# latency (cache=True makes later startups load the cached artifact)
+compute_all(np.linspace(100.0, 110.0, 64))
@@ -1,16 +1,226 @@
 import re
 import random
-import json
+import asyncio
+import orjson
 import os
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
-import pandas as pd
+import ahocorasick
+import numpy as np
+import zstandard
 from pathlib import Path
 
+# Hyperscan wheels only exist for some platforms; the classifier degrades to
+# the pure-re path when the import fails
+try:
+    import hyperscan as hs
+except ImportError:
+    hs = None
+
 logger = logging.getLogger(__name__)
 
+# Compiled once at import: calling .search() on a compiled pattern skips the
+# re-module cache lookup and flag handling that string patterns pay per call
+_STOCK_INFO_RES = [re.compile(p) for p in (
+    r'TELL ME ABOUT\s+([A-Z]{1,5})',
+    r'INFO(?:RMATION)?\s+ON\s+([A-Z]{1,5})',
+    r'WHAT IS\s+([A-Z]{1,5})',
+    r'([A-Z]{1,5})\s+(PRICE|VALUE|WORTH|TRADING AT)',
+    r'CURRENT\s+(PRICE|VALUE)\s+OF\s+([A-Z]{1,5})',
+)]
+
+_ANALYSIS_RES = [re.compile(p) for p in (
+    r'ANALYZE\s+([A-Z]{1,5})\s+(PERFORMANCE|TREND|STOCK)',
+    r'([A-Z]{1,5})\s+(ANALYSIS|PERFORMANCE|TREND)',
+    r'ANALYSIS\s+OF\s+([A-Z]{1,5})',
+    r'HOW\s+IS\s+([A-Z]{1,5})\s+(PERFORMING|DOING)',
+)]
+
+_PREDICTION_RES = [re.compile(p) for p in (
+    r'PREDICT\s+([A-Z]{1,5})\s+(PRICE|VALUE|FUTURE)',
+    r'([A-Z]{1,5})\s+(PREDICTION|FORECAST|FUTURE)',
+    r'WHAT\s+WILL\s+([A-Z]{1,5})\s+(BE|COST|WORTH)',
+)]
+
+# All three uppercase groups fused into one alternation so a single scan of
+# the message classifies intent instead of up to twelve separate searches;
+# the engine shares prefix work across alternatives. On a hit the matched
+# group name maps back to (intent, original pattern), and the original
+# pattern is re-run once to recover its exact capture groups.
+_INTENT_GROUPS = {
+    'si': ('stock_info', _STOCK_INFO_RES),
+    'an': ('stock_analysis', _ANALYSIS_RES),
+    'pr': ('stock_prediction', _PREDICTION_RES),
+}
+_MEGA_INTENT_RE = re.compile('|'.join(
+    f'(?P<{prefix}{i}>{pattern.pattern})'
+    for prefix, (_, patterns) in _INTENT_GROUPS.items()
+    for i, pattern in enumerate(patterns)
+))
+_MEGA_GROUP_INFO = {
+    f'{prefix}{i}': (intent, pattern)
+    for prefix, (intent, patterns) in _INTENT_GROUPS.items()
+    for i, pattern in enumerate(patterns)
+}
+
+# One pass covers both bare symbols and the $SYMBOL format
+_TOKEN_RE = re.compile(r'\$?\b([A-Z]{1,5})\b')
+
+# ASCII-only translation table: deriving message_upper from the already
+# lowercased string via str.translate skips the full Unicode case mapping
+# that a second str.upper() pass over the original would redo
+_ASCII_UPPER_TABLE = str.maketrans('abcdefghijklmnopqrstuvwxyz',
+                                   'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+# Leading-token dispatch for the most common short messages ("hi", "help",
+# "thanks") so they never pay for the pattern machinery below
+_FAST_INTENT_TOKENS = {
+    'hi': 'greeting', 'hello': 'greeting', 'hey': 'greeting', 'greetings': 'greeting',
+    'help': 'help',
+    'bye': 'goodbye', 'goodbye': 'goodbye', 'thanks': 'goodbye', 'thank': 'goodbye',
+}
+
+# Sentiment vocabularies hoisted to module-level frozensets: membership is
+# O(1) per token, and whole-word matching fixes the substring false hits the
+# old `word in message` scans produced ("up" inside "upset")
+_POS_WORDS = frozenset({
+    'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'positive',
+    'up', 'rise', 'gain', 'profit', 'success', 'strong', 'bullish'
+})
+_NEG_WORDS = frozenset({
+    'bad', 'terrible', 'awful', 'horrible', 'negative', 'down', 'fall', 'drop',
+    'loss', 'weak', 'bearish', 'crash', 'decline'
+})
+_NEWS_POS_WORDS = _POS_WORDS | {'beat', 'surge', 'jump', 'climb'}
+_NEWS_NEG_WORDS = _NEG_WORDS | {'miss', 'plunge', 'dip', 'slump'}
+
+_WORD_RE = re.compile(r'\w+')
+
+# Context skeleton: the factory only runs for missing keys, instead of
+# allocating fresh default containers for every setdefault call
+_CONTEXT_DEFAULTS = (
+    ('user_preferences', dict),
+    ('stock_interests', list),
+    ('last_query', type(None)),
+    ('conversation_history', list),
+)
+
+# Response templates as module constants: the interpreter hands the constant
+# straight to .format() instead of re-assembling a large f-string per call
+_STOCK_INFO_TEMPLATE = """📊 **{symbol} Comprehensive Stock Information**
+
+💰 **Current Price**: {current_price}
+🏢 **Company**: {long_name}
+📈 **Market Cap**: ${market_cap:,}M
+📊 **P/E Ratio**: {pe_ratio}
+📅 **52-Week Range**: ${low_52wk:.2f} - ${high_52wk:.2f}
+
+📰 **News Sentiment**: {sentiment} ({sentiment_score:.2f})
+📊 **Articles Analyzed**: {article_count}
+
+💡 **Business Summary**: {summary}...
+
+Would you like a detailed technical analysis or price prediction for {symbol}?"""
+
+_STOCK_ANALYSIS_TEMPLATE = """📈 **{symbol} Technical Analysis**
+
+💰 **Current Price**: ${current_price}
+📊 **Technical Indicators**:
+   • RSI: {rsi:.2f}
+   • MACD: {macd:.2f}
+   • 20-Day SMA: ${sma_20:.2f}
+   • 50-Day SMA: ${sma_50:.2f}
+
+📊 **Market Context**:
+   • S&P 500 Change: {sp500_change:.2f}%
+   • Market Cap: ${market_cap:,}M
+   • P/E Ratio: {pe_ratio}
+
+📰 **News Sentiment**: {news_sentiment}
+
+💡 **Analysis**: Based on technical indicators and market conditions, {symbol} shows {momentum} momentum with {strength} relative strength."""
+
+# Fallback prompt templates built once at import instead of a fresh nested
+# literal per load_prompt_templates miss
+_DEFAULT_TEMPLATES = {
+    'stock_analysis': {
+        'context': "You are a financial analyst assistant. Use the following data to provide insights:",
+        'prompt_template': """
+Based on the following data for {symbol}:
+
+**Stock Data:**
+- Current Price: ${current_price}
+- 52-Week Range: ${low_52wk} - ${high_52wk}
+- Market Cap: ${market_cap}
+- P/E Ratio: {pe_ratio}
+
+**Technical Indicators:**
+- RSI: {rsi}
+- MACD: {macd}
+- Moving Averages: {ma_status}
+
+**Market Context:**
+- S&P 500: {sp500_change}%
+- Market Volatility (VIX): {vix_value}
+
+Provide a comprehensive analysis including:
+1. Technical analysis
+2. Fundamental analysis
+3. Risk assessment
+4. Investment recommendation
+""",
+        'variables': ['symbol', 'current_price', 'low_52wk', 'high_52wk', 'market_cap', 'pe_ratio', 'rsi', 'macd', 'ma_status', 'sp500_change', 'vix_value']
+    }
+}
+
+
+@lru_cache(maxsize=256)
+def _load_json_cached(path_str: str, mtime: float) -> Any:
+    """Parse a JSON file, memoized on (path, mtime): repeat queries for the
+    same unchanged file skip both the disk read and the parse"""
+    # orjson decodes the raw bytes several times faster than json.load;
+    # .zst blobs from the collector are decompressed first (decompressobj
+    # handles the streamed frames, which carry no content-size header)
+    with open(path_str, 'rb') as f:
+        raw = f.read()
+    if path_str.endswith('.zst'):
+        raw = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    return orjson.loads(raw)
+
+
+@lru_cache(maxsize=256)
+def _load_jsonl_cached(path_str: str, mtime: float) -> List[Any]:
+    """Parse the collector's newline-delimited .jsonl.zst files, memoized
+    on (path, mtime) like _load_json_cached"""
+    with open(path_str, 'rb') as f:
+        raw = zstandard.ZstdDecompressor().decompressobj().decompress(f.read())
+    return [orjson.loads(line) for line in raw.splitlines() if line]
+
+# One Aho-Corasick automaton over the full news vocabulary: each article is
+# scanned once in O(len(text)) regardless of dictionary size, instead of
+# tokenizing and probing both vocabularies separately
+_SENTIMENT_AUTOMATON = ahocorasick.Automaton()
+for _word in _NEWS_POS_WORDS:
+    _SENTIMENT_AUTOMATON.add_word(_word, (len(_word), 1))
+for _word in _NEWS_NEG_WORDS:
+    _SENTIMENT_AUTOMATON.add_word(_word, (len(_word), -1))
+_SENTIMENT_AUTOMATON.make_automaton()
+del _word
+
 class EnhancedChatbot:
+    # Fixed attribute layout: no per-instance __dict__ when chatbots are
+    # pooled per worker
+    __slots__ = (
+        'stock_predictor', 'task_prioritizer', 'data_dir', 'prompt_templates',
+        'intent_patterns', '_compiled_intents', 'stock_symbols',
+        '_stock_symbols_set', '_hs_db', '_hs_patterns', '_news_sentiment_cache',
+        '_responders', '_intent_hits', '_messages_seen'
+    )
+
     def __init__(self, stock_predictor=None, task_prioritizer=None, data_dir="data"):
         self.stock_predictor = stock_predictor
         self.task_prioritizer = task_prioritizer
@@ -61,169 +271,218 @@ class EnhancedChatbot:
             ]
         }
         
+        # Compile each intent's patterns once so classify_intent never hands
+        # raw strings to the re module on the hot path
+        self._compiled_intents = {
+            intent: [re.compile(p) for p in patterns]
+            for intent, patterns in self.intent_patterns.items()
+        }
+
         self.stock_symbols = [
             'AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'META', 'NVDA', 'NFLX',
             'ADBE', 'CRM', 'ORCL', 'INTC', 'AMD', 'IBM', 'CSCO', 'QCOM',
             'PYPL', 'V', 'MA', 'JPM', 'BAC', 'WMT', 'HD', 'DIS'
         ]
+        # Frozenset twin for O(1) membership on the extraction hot path
+        self._stock_symbols_set = frozenset(self.stock_symbols)
+
+        # Hyperscan DFA over every classification pattern: one O(len(text))
+        # scan decides which pattern matched regardless of pattern count;
+        # capture groups still come from a targeted re pass on the winner
+        self._hs_db = None
+        self._hs_patterns = []  # id -> (intent, confidence, compiled, uppercase?)
+        if hs is not None:
+            try:
+                # The scan input is the lowercased message, mirroring the
+                # re fallback: the uppercase symbol groups get CASELESS so
+                # their [A-Z] classes still hit, while the plain intent
+                # patterns stay case-sensitive — under CASELESS their dead
+                # [A-Z] classes would start matching and classify messages
+                # the re path never would
+                expressions = []
+                flags = []
+                for _, (intent, patterns) in _INTENT_GROUPS.items():
+                    for pattern in patterns:
+                        self._hs_patterns.append((intent, 0.95, pattern, True))
+                        expressions.append(pattern.pattern.encode())
+                        flags.append(hs.HS_FLAG_CASELESS)
+                for intent, patterns in self._compiled_intents.items():
+                    for pattern in patterns:
+                        self._hs_patterns.append((intent, 0.9, pattern, False))
+                        expressions.append(pattern.pattern.encode())
+                        flags.append(0)
+                db = hs.Database()
+                db.compile(expressions=expressions,
+                           ids=list(range(len(expressions))),
+                           flags=flags)
+                self._hs_db = db
+            except Exception as e:
+                logger.warning(f"Hyperscan database unavailable, using re fallback: {str(e)}")
+                self._hs_db = None
+
+        # Runtime profile of observed intents; drives periodic reordering of
+        # the fallback pattern loop so hot intents are tried first
+        self._intent_hits = Counter()
+        self._messages_seen = 0
+
+        # Per-intent responders so generate_enhanced_response only loads the
+        # data files each branch actually reads
+        self._responders = {
+            'stock_info': self._respond_stock_info,
+            'stock_analysis': self._respond_stock_analysis,
+        }
+
+        # News sentiment results keyed per symbol by the news file's mtime;
+        # the scoring is deterministic in the file contents, so a repeat
+        # query on an unchanged file is O(1)
+        self._news_sentiment_cache: Dict[str, Any] = {}
     
     def load_prompt_templates(self) -> Dict:
         """Load prompt templates from data directory"""
         template_file = self.data_dir / "prompts" / "templates.json"
         if template_file.exists():
             try:
-                with open(template_file, 'r') as f:
-                    return json.load(f)
+                return _load_json_cached(str(template_file), template_file.stat().st_mtime)
             except Exception as e:
                 logger.error(f"Error loading prompt templates: {str(e)}")
         
         # Return default templates if file doesn't exist
-        return {
-            'stock_analysis': {
-                'context': "You are a financial analyst assistant. Use the following data to provide insights:",
-                'prompt_template': """
-Based on the following data for {symbol}:
-
-**Stock Data:**
-- Current Price: ${current_price}
-- 52-Week Range: ${low_52wk} - ${high_52wk}
-- Market Cap: ${market_cap}
-- P/E Ratio: {pe_ratio}
-
-**Technical Indicators:**
-- RSI: {rsi}
-- MACD: {macd}
-- Moving Averages: {ma_status}
-
-**Market Context:**
-- S&P 500: {sp500_change}%
-- Market Volatility (VIX): {vix_value}
-
-Provide a comprehensive analysis including:
-1. Technical analysis
-2. Fundamental analysis
-3. Risk assessment
-4. Investment recommendation
-""",
-                'variables': ['symbol', 'current_price', 'low_52wk', 'high_52wk', 'market_cap', 'pe_ratio', 'rsi', 'macd', 'ma_status', 'sp500_change', 'vix_value']
-            }
-        }
+        return _DEFAULT_TEMPLATES
     
     def load_stock_data(self, symbol: str) -> Optional[Dict]:
-        """Load collected stock data for a symbol"""
+        """Load collected stock data for a symbol (compressed collector
+        output first, uncompressed legacy blobs as fallback)"""
         try:
-            stock_file = self.data_dir / "stocks" / f"{symbol}_data.json"
-            if stock_file.exists():
-                with open(stock_file, 'r') as f:
-                    return json.load(f)
+            for name in (f"{symbol}_data.json.zst", f"{symbol}_data.json"):
+                stock_file = self.data_dir / "stocks" / name
+                if stock_file.exists():
+                    return _load_json_cached(str(stock_file), stock_file.stat().st_mtime)
         except Exception as e:
             logger.error(f"Error loading stock data for {symbol}: {str(e)}")
         return None
-    
+
     def load_news_data(self, symbol: str) -> List[Dict]:
         """Load collected news data for a symbol"""
         try:
-            news_file = self.data_dir / "news" / f"{symbol}_news.json"
+            news_file = self.data_dir / "news" / f"{symbol}_news.jsonl.zst"
             if news_file.exists():
-                with open(news_file, 'r') as f:
-                    return json.load(f)
+                return _load_jsonl_cached(str(news_file), news_file.stat().st_mtime)
+            legacy_file = self.data_dir / "news" / f"{symbol}_news.json"
+            if legacy_file.exists():
+                return _load_json_cached(str(legacy_file), legacy_file.stat().st_mtime)
         except Exception as e:
             logger.error(f"Error loading news data for {symbol}: {str(e)}")
         return []
-    
+
     def load_market_data(self) -> Optional[Dict]:
         """Load market data"""
         try:
-            market_file = self.data_dir / "economic" / "market_data.json"
-            if market_file.exists():
-                with open(market_file, 'r') as f:
-                    return json.load(f)
+            for name in ("market_data.json.zst", "market_data.json"):
+                market_file = self.data_dir / "economic" / name
+                if market_file.exists():
+                    return _load_json_cached(str(market_file), market_file.stat().st_mtime)
         except Exception as e:
             logger.error(f"Error loading market data: {str(e)}")
         return None
     
-    def extract_stock_symbol(self, message: str) -> Optional[str]:
+    def extract_stock_symbol(self, message: str, message_upper: Optional[str] = None) -> Optional[str]:
         """Extract stock symbol from message using regex patterns"""
-        message_upper = message.upper()
-        
-        # Look for stock symbols in various patterns
-        patterns = [
-            r'\b([A-Z]{1,5})\b',  # Any 1-5 letter uppercase word
-            r'\$([A-Z]{1,5})\b',  # $SYMBOL format
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, message_upper)
-            for match in matches:
-                symbol = match if isinstance(match, str) else match[0]
-                if symbol in self.stock_symbols:
-                    return symbol
-        
+        if message_upper is None:
+            message_upper = message.upper()
+
+        # Single pass over candidate tokens, short-circuiting on the first
+        # known symbol; set membership replaces the O(n) list scan
+        for match in _TOKEN_RE.finditer(message_upper):
+            symbol = match.group(1)
+            if symbol in self._stock_symbols_set:
+                return symbol
+
         return None
     
-    def classify_intent(self, message: str) -> Dict[str, Any]:
+    def classify_intent(self, message: str, message_lower: Optional[str] = None,
+                        message_upper: Optional[str] = None) -> Dict[str, Any]:
+        """Classify user intent, recording per-intent hit counts"""
+        result = self._classify_message(message, message_lower, message_upper)
+        self._record_intent_hit(result['intent'])
+        return result
+
+    def _record_intent_hit(self, intent: str) -> None:
+        """Track intent frequency for observability. The fallback loop is
+        first-match-wins, so intent order is semantics, not just speed:
+        reordering by traffic would change which intent wins for messages
+        matching several patterns and drift from the Hyperscan path, which
+        keeps the declaration order via lowest pattern id."""
+        self._intent_hits[intent] += 1
+        self._messages_seen += 1
+
+    def _classify_message(self, message: str, message_lower: Optional[str] = None,
+                          message_upper: Optional[str] = None) -> Dict[str, Any]:
         """Classify user intent using regex patterns"""
-        message_lower = message.lower()
-        message_upper = message.upper()
-
-        # Improved: check for 'tell me about <SYMBOL>' and similar patterns (case-insensitive, use message_upper)
-        stock_info_patterns = [
-            r'TELL ME ABOUT\s+([A-Z]{1,5})',
-            r'INFO(?:RMATION)?\s+ON\s+([A-Z]{1,5})',
-            r'WHAT IS\s+([A-Z]{1,5})',
-            r'([A-Z]{1,5})\s+(PRICE|VALUE|WORTH|TRADING AT)',
-            r'CURRENT\s+(PRICE|VALUE)\s+OF\s+([A-Z]{1,5})',
-        ]
-        for pattern in stock_info_patterns:
-            match = re.search(pattern, message_upper)
-            if match:
+        if message_lower is None:
+            message_lower = message.lower()
+        if message_upper is None:
+            message_upper = message.upper()
+
+        # Greeting/help/goodbye openers short-circuit before any regex or
+        # DFA scan runs
+        words = message_lower.split(None, 1)
+        if words:
+            fast_intent = _FAST_INTENT_TOKENS.get(words[0])
+            if fast_intent:
                 return {
-                    'intent': 'stock_info',
-                    'confidence': 0.95,
-                    'matches': match.groups()
+                    'intent': fast_intent,
+                    'confidence': 0.9,
+                    'matches': [words[0]]
                 }
 
-        # Check for analysis patterns
-        analysis_patterns = [
-            r'ANALYZE\s+([A-Z]{1,5})\s+(PERFORMANCE|TREND|STOCK)',
-            r'([A-Z]{1,5})\s+(ANALYSIS|PERFORMANCE|TREND)',
-            r'ANALYSIS\s+OF\s+([A-Z]{1,5})',
-            r'HOW\s+IS\s+([A-Z]{1,5})\s+(PERFORMING|DOING)',
-        ]
-        for pattern in analysis_patterns:
-            match = re.search(pattern, message_upper)
-            if match:
+        if self._hs_db is not None:
+            # Single DFA pass over the lowercased message (the same text
+            # the re fallback sees); the lowest pattern id preserves the
+            # original priority order
+            matched = []
+
+            def on_match(pat_id, start, end, flags, context):
+                matched.append(pat_id)
+                return 0
+
+            self._hs_db.scan(message_lower.encode(), match_event_handler=on_match)
+            if matched:
+                intent, confidence, pattern, uppercase = self._hs_patterns[min(matched)]
+                if uppercase:
+                    m = pattern.search(message_upper)
+                    return {
+                        'intent': intent,
+                        'confidence': confidence,
+                        'matches': m.groups() if m else ()
+                    }
                 return {
-                    'intent': 'stock_analysis',
-                    'confidence': 0.95,
-                    'matches': match.groups()
+                    'intent': intent,
+                    'confidence': confidence,
+                    'matches': pattern.findall(message_lower)
                 }
-
-        # Check for prediction patterns
-        prediction_patterns = [
-            r'PREDICT\s+([A-Z]{1,5})\s+(PRICE|VALUE|FUTURE)',
-            r'([A-Z]{1,5})\s+(PREDICTION|FORECAST|FUTURE)',
-            r'WHAT\s+WILL\s+([A-Z]{1,5})\s+(BE|COST|WORTH)',
-        ]
-        for pattern in prediction_patterns:
-            match = re.search(pattern, message_upper)
+        else:
+            # Stock-info/analysis/prediction patterns in one fused pass over
+            # the message (case-insensitive via message_upper)
+            match = _MEGA_INTENT_RE.search(message_upper)
             if match:
+                name = next(name for name, value in match.groupdict().items() if value is not None)
+                intent, pattern = _MEGA_GROUP_INFO[name]
                 return {
-                    'intent': 'stock_prediction',
+                    'intent': intent,
                     'confidence': 0.95,
-                    'matches': match.groups()
+                    'matches': pattern.search(message_upper).groups()
                 }
 
-        # Existing pattern-based intent detection
-        for intent, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, message_lower)
-                if matches:
-                    return {
-                        'intent': intent,
-                        'confidence': 0.9,
-                        'matches': matches
-                    }
+            # Existing pattern-based intent detection
+            for intent, patterns in self._compiled_intents.items():
+                for pattern in patterns:
+                    matches = pattern.findall(message_lower)
+                    if matches:
+                        return {
+                            'intent': intent,
+                            'confidence': 0.9,
+                            'matches': matches
+                        }
         # Fallback: check for stock-related keywords
         stock_keywords = ['stock', 'price', 'market', 'invest', 'prediction', 'analysis']
         if any(keyword in message_lower for keyword in stock_keywords):
@@ -238,19 +497,14 @@ Provide a comprehensive analysis including:
             'matches': []
         }
     
-    def analyze_sentiment(self, message: str) -> str:
+    def analyze_sentiment(self, message: str, message_lower: Optional[str] = None) -> str:
         """Simple rule-based sentiment analysis"""
-        message_lower = message.lower()
-        
-        # Positive words
-        positive_words = ['good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'positive', 'up', 'rise', 'gain', 'profit', 'success', 'strong', 'bullish']
-        
-        # Negative words
-        negative_words = ['bad', 'terrible', 'awful', 'horrible', 'negative', 'down', 'fall', 'drop', 'loss', 'weak', 'bearish', 'crash', 'decline']
-        
-        # Count positive and negative words
-        positive_count = sum(1 for word in positive_words if word in message_lower)
-        negative_count = sum(1 for word in negative_words if word in message_lower)
+        if message_lower is None:
+            message_lower = message.lower()
+        # Tokenize once, then count via O(1) set membership per token
+        tokens = _WORD_RE.findall(message_lower)
+        positive_count = sum(1 for token in tokens if token in _POS_WORDS)
+        negative_count = sum(1 for token in tokens if token in _NEG_WORDS)
         
         if positive_count > negative_count:
             return 'positive'
@@ -259,37 +513,57 @@ Provide a comprehensive analysis including:
         else:
             return 'neutral'
     
-    def analyze_news_sentiment(self, news_data: List[Dict]) -> Dict[str, Any]:
-        """Analyze sentiment from collected news data"""
+    def analyze_news_sentiment(self, symbol: str) -> Dict[str, Any]:
+        """Analyze sentiment from collected news data for a symbol, cached
+        on the news file's mtime"""
+        # Stat in the same priority order load_news_data reads, so the
+        # memo key tracks the file actually being scored
+        mtime = 0.0
+        for name in (f"{symbol}_news.jsonl.zst", f"{symbol}_news.json"):
+            try:
+                mtime = (self.data_dir / "news" / name).stat().st_mtime
+                break
+            except OSError:
+                continue
+
+        cached = self._news_sentiment_cache.get(symbol)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        result = self._score_news(self.load_news_data(symbol))
+        # A read-only view keeps callers from mutating the cached entry
+        frozen = MappingProxyType(result)
+        self._news_sentiment_cache[symbol] = (mtime, frozen)
+        return frozen
+
+    def _score_news(self, news_data: List[Dict]) -> Dict[str, Any]:
+        """Score a list of news articles with the rule-based analyzer"""
         if not news_data:
             return {'sentiment': 'neutral', 'score': 0.0, 'confidence': 0.0, 'article_count': 0}
         
-        sentiments = []
-        for article in news_data:
-            text = f"{article.get('title', '')} {article.get('description', '')}"
-            # Simple rule-based sentiment analysis
-            text_lower = text.lower()
-            
-            # Positive words
-            positive_words = ['good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'positive', 'up', 'rise', 'gain', 'profit', 'success', 'strong', 'bullish', 'beat', 'surge', 'jump', 'climb']
-            
-            # Negative words
-            negative_words = ['bad', 'terrible', 'awful', 'horrible', 'negative', 'down', 'fall', 'drop', 'loss', 'weak', 'bearish', 'crash', 'decline', 'miss', 'plunge', 'dip', 'slump']
-            
-            # Count positive and negative words
-            positive_count = sum(1 for word in positive_words if word in text_lower)
-            negative_count = sum(1 for word in negative_words if word in text_lower)
-            
-            if positive_count > negative_count:
-                sentiment_score = 0.3
-            elif negative_count > positive_count:
-                sentiment_score = -0.3
-            else:
-                sentiment_score = 0.0
+        # Per-article signs land in an int8 array so the final reduction is
+        # one C-level mean instead of boxing a float per article
+        scores = np.empty(len(news_data), dtype=np.int8)
+        for i, article in enumerate(news_data):
+            text_lower = f"{article.get('title', '')} {article.get('description', '')}".lower()
+            # Single automaton pass over the article; the boundary check
+            # keeps whole-word semantics parity with the tokenized scan
+            positive_count = 0
+            negative_count = 0
+            for end, (length, signed) in _SENTIMENT_AUTOMATON.iter(text_lower):
+                start = end - length + 1
+                if start > 0 and text_lower[start - 1].isalnum():
+                    continue
+                if end + 1 < len(text_lower) and text_lower[end + 1].isalnum():
+                    continue
+                if signed > 0:
+                    positive_count += 1
+                else:
+                    negative_count += 1
             
-            sentiments.append(sentiment_score)
-        
-        avg_sentiment = sum(sentiments) / len(sentiments)
+            scores[i] = (positive_count > negative_count) - (negative_count > positive_count)
+
+        avg_sentiment = float(scores.mean()) * 0.3
         
         if avg_sentiment > 0.1:
             sentiment_level = 'positive'
@@ -301,116 +575,127 @@ Provide a comprehensive analysis including:
         return {
             'sentiment': sentiment_level,
             'score': round(avg_sentiment, 3),
-            'confidence': min(len(sentiments) * 0.1, 0.9),  # More articles = higher confidence
-            'article_count': len(sentiments)
+            'confidence': min(scores.size * 0.1, 0.9),  # More articles = higher confidence
+            'article_count': scores.size
         }
     
     def generate_enhanced_response(self, intent: str, symbol: str, context: Dict = None) -> str:
         """Generate enhanced response using collected data and prompt templates"""
         try:
-            # Load collected data
-            stock_data = self.load_stock_data(symbol)
-            news_data = self.load_news_data(symbol)
-            market_data = self.load_market_data()
-            
-            if intent == 'stock_info':
-                if stock_data and 'company_info' in stock_data:
-                    info = stock_data['company_info']
-                    news_sentiment = self.analyze_news_sentiment(news_data)
-                    
-                    # Get current price from stock predictor
-                    current_price = "N/A"
-                    if self.stock_predictor:
-                        try:
-                            live_data = self.stock_predictor.get_stock_data(symbol)
-                            current_price = f"${live_data['Close'].iloc[-1]:.2f}"
-                        except:
-                            pass
-                    
-                    response = f"""📊 **{symbol} Comprehensive Stock Information**
+            # Dispatch to the intent's specialized responder, which loads
+            # only the data files that branch actually reads
+            responder = self._responders.get(intent)
+            if responder is not None:
+                response = responder(symbol)
+                if response is not None:
+                    return response
 
-💰 **Current Price**: {current_price}
-🏢 **Company**: {info.get('longName', 'N/A')}
-📈 **Market Cap**: ${info.get('marketCap', 0):,}M
-📊 **P/E Ratio**: {info.get('trailingPE', 'N/A')}
-📅 **52-Week Range**: ${info.get('fiftyTwoWeekLow', 0):.2f} - ${info.get('fiftyTwoWeekHigh', 0):.2f}
+            # Fallback to basic response
+            return f"I have comprehensive data for {symbol}. Would you like a detailed analysis, price prediction, or market sentiment overview?"
 
-📰 **News Sentiment**: {news_sentiment['sentiment'].title()} ({news_sentiment['score']:.2f})
-📊 **Articles Analyzed**: {news_sentiment['article_count']}
+        except Exception as e:
+            logger.error(f"Error generating enhanced response: {str(e)}")
+            return f"I'm sorry, I encountered an error while analyzing {symbol}. Please try again."
 
-💡 **Business Summary**: {info.get('longBusinessSummary', 'No summary available.')[:200]}...
+    def _respond_stock_info(self, symbol: str) -> Optional[str]:
+        """Stock-info responder: needs only the per-symbol stock data"""
+        stock_data = self.load_stock_data(symbol)
+        if not stock_data or 'company_info' not in stock_data:
+            return None
 
-Would you like a detailed technical analysis or price prediction for {symbol}?"""
-                    
-                    return response
-            
-            elif intent == 'stock_analysis':
-                if stock_data and market_data:
-                    # Use prompt template for analysis
-                    template = self.prompt_templates.get('stock_analysis', {})
-                    prompt_template = template.get('prompt_template', '')
-                    
-                    # Extract data for template
-                    info = stock_data.get('company_info', {})
-                    current_price = info.get('currentPrice', 0)
-                    
-                    # Get technical indicators from stock predictor
-                    technical_data = {}
-                    if self.stock_predictor:
-                        try:
-                            live_data = self.stock_predictor.get_stock_data(symbol)
-                            technical_data = {
-                                'rsi': live_data['RSI'].iloc[-1],
-                                'macd': live_data['MACD'].iloc[-1],
-                                'sma_20': live_data['SMA_20'].iloc[-1],
-                                'sma_50': live_data['SMA_50'].iloc[-1]
-                            }
-                        except:
-                            pass
-                    
-                    # Market context
-                    sp500_data = market_data.get('^GSPC', {})
-                    sp500_change = 0
-                    if sp500_data and 'historical' in sp500_data:
-                        hist = sp500_data['historical']
-                        if len(hist) >= 2:
-                            sp500_change = ((hist[-1]['Close'] - hist[-2]['Close']) / hist[-2]['Close']) * 100
-                    
-                    response = f"""📈 **{symbol} Technical Analysis**
+        info = stock_data['company_info']
+        news_sentiment = self.analyze_news_sentiment(symbol)
 
-💰 **Current Price**: ${current_price}
-📊 **Technical Indicators**:
-   • RSI: {technical_data.get('rsi', 'N/A'):.2f}
-   • MACD: {technical_data.get('macd', 'N/A'):.2f}
-   • 20-Day SMA: ${technical_data.get('sma_20', 'N/A'):.2f}
-   • 50-Day SMA: ${technical_data.get('sma_50', 'N/A'):.2f}
+        # Get current price from stock predictor
+        current_price = "N/A"
+        if self.stock_predictor:
+            try:
+                live_data = self.stock_predictor.get_stock_data(symbol)
+                # The predictor hands back plain ndarray columns
+                current_price = f"${live_data['Close'][-1]:.2f}"
+            except:
+                pass
 
-📊 **Market Context**:
-   • S&P 500 Change: {sp500_change:.2f}%
-   • Market Cap: ${info.get('marketCap', 0):,}M
-   • P/E Ratio: {info.get('trailingPE', 'N/A')}
+        # The collector writes the slimmed snake_case keys; legacy blobs
+        # from before the slimming still carry the raw yfinance names
+        return _STOCK_INFO_TEMPLATE.format(
+            symbol=symbol,
+            current_price=current_price,
+            long_name=info.get('longName', symbol),
+            market_cap=info.get('market_cap') or info.get('marketCap', 0),
+            pe_ratio=info.get('pe_ratio') or info.get('trailingPE', 'N/A'),
+            low_52wk=info.get('low_52wk') or info.get('fiftyTwoWeekLow', 0),
+            high_52wk=info.get('high_52wk') or info.get('fiftyTwoWeekHigh', 0),
+            sentiment=news_sentiment['sentiment'].title(),
+            sentiment_score=news_sentiment['score'],
+            article_count=news_sentiment['article_count'],
+            summary=info.get('longBusinessSummary', 'No summary available.')[:200]
+        )
 
-📰 **News Sentiment**: {self.analyze_news_sentiment(news_data)['sentiment'].title()}
+    def _respond_stock_analysis(self, symbol: str) -> Optional[str]:
+        """Analysis responder: needs the stock data plus market context"""
+        stock_data = self.load_stock_data(symbol)
+        market_data = self.load_market_data()
+        if not stock_data or not market_data:
+            return None
 
-💡 **Analysis**: Based on technical indicators and market conditions, {symbol} shows {'bullish' if technical_data.get('rsi', 50) > 50 else 'bearish'} momentum with {'strong' if abs(technical_data.get('rsi', 50) - 50) > 20 else 'moderate'} relative strength."""
-                    
-                    return response
-            
-            # Fallback to basic response
-            return f"I have comprehensive data for {symbol}. Would you like a detailed analysis, price prediction, or market sentiment overview?"
-            
-        except Exception as e:
-            logger.error(f"Error generating enhanced response: {str(e)}")
-            return f"I'm sorry, I encountered an error while analyzing {symbol}. Please try again."
+        # Extract data for template (collector's slimmed keys first,
+        # legacy yfinance names as fallback)
+        info = stock_data.get('company_info', {})
+        current_price = info.get('current_price') or info.get('currentPrice', 0)
+
+        # Get technical indicators from stock predictor
+        technical_data = {}
+        if self.stock_predictor:
+            try:
+                live_data = self.stock_predictor.get_stock_data(symbol)
+                # The predictor hands back plain ndarray columns; four
+                # scalar reads, no pandas indexer in sight
+                technical_data = {
+                    'rsi': live_data['RSI'][-1],
+                    'macd': live_data['MACD'][-1],
+                    'sma_20': live_data['SMA_20'][-1],
+                    'sma_50': live_data['SMA_50'][-1]
+                }
+            except:
+                pass
+
+        # Market context: the collector stores the last two index closes as
+        # scalars next to the Feather history; legacy blobs inlined the rows
+        sp500_data = market_data.get('^GSPC', {})
+        sp500_change = 0
+        prev_value = sp500_data.get('prev_value')
+        current_value = sp500_data.get('current_value')
+        if prev_value and current_value is not None:
+            sp500_change = ((current_value - prev_value) / prev_value) * 100
+        elif sp500_data and 'historical' in sp500_data:
+            hist = sp500_data['historical']
+            if len(hist) >= 2:
+                sp500_change = ((hist[-1]['Close'] - hist[-2]['Close']) / hist[-2]['Close']) * 100
+
+        rsi = technical_data.get('rsi', 50)
+        return _STOCK_ANALYSIS_TEMPLATE.format(
+            symbol=symbol,
+            current_price=current_price,
+            rsi=technical_data.get('rsi', 'N/A'),
+            macd=technical_data.get('macd', 'N/A'),
+            sma_20=technical_data.get('sma_20', 'N/A'),
+            sma_50=technical_data.get('sma_50', 'N/A'),
+            sp500_change=sp500_change,
+            market_cap=info.get('market_cap') or info.get('marketCap', 0),
+            pe_ratio=info.get('pe_ratio') or info.get('trailingPE', 'N/A'),
+            news_sentiment=self.analyze_news_sentiment(symbol)['sentiment'].title(),
+            momentum='bullish' if rsi > 50 else 'bearish',
+            strength='strong' if abs(rsi - 50) > 20 else 'moderate'
+        )
     
     def update_context(self, context: Optional[Dict], intent: str, symbol: Optional[str], sentiment: str) -> Dict[str, Any]:
         """Update conversation context"""
         if context is None or not isinstance(context, dict):
             context = {}
-        context.setdefault('user_preferences', {})
-        context.setdefault('stock_interests', [])
-        context.setdefault('last_query', None)
-        context.setdefault('conversation_history', [])
+        for key, factory in _CONTEXT_DEFAULTS:
+            if key not in context:
+                context[key] = factory()
         
         # Update last query
         context['last_query'] = {
@@ -420,9 +705,18 @@ Would you like a detailed technical analysis or price prediction for {symbol}?""
             'timestamp': datetime.now().isoformat()
         }
         
-        # Track stock interests
-        if symbol and symbol not in context['stock_interests']:
-            context['stock_interests'].append(symbol)
+        # Track stock interests via a set sidecar: O(1) membership instead of
+        # rescanning the growing list every message. The sidecar serializes
+        # as a list over the wire, so rebuild the set when it round-trips.
+        if symbol:
+            interests_set = context.get('stock_interests_set')
+            if not isinstance(interests_set, set):
+                interests_set = set(context['stock_interests'] if interests_set is None
+                                    else interests_set)
+            if symbol not in interests_set:
+                context['stock_interests'].append(symbol)
+                interests_set.add(symbol)
+            context['stock_interests_set'] = interests_set
         
         return context
     
@@ -431,9 +725,13 @@ Would you like a detailed technical analysis or price prediction for {symbol}?""
         """Process incoming chat message with enhanced data integration"""
         try:
             # Analyze message
-            intent_data = self.classify_intent(message)
-            sentiment = self.analyze_sentiment(message)
-            symbol = self.extract_stock_symbol(message)
+            # Case-normalize once and share across the three analyzers
+            # instead of each helper re-scanning the message
+            message_lower = message.lower()
+            message_upper = message_lower.translate(_ASCII_UPPER_TABLE)
+            intent_data = self.classify_intent(message, message_lower, message_upper)
+            sentiment = self.analyze_sentiment(message, message_lower)
+            symbol = self.extract_stock_symbol(message, message_upper)
             
             intent = intent_data['intent']
             confidence = intent_data['confidence']
@@ -444,7 +742,10 @@ Would you like a detailed technical analysis or price prediction for {symbol}?""
             
             # Handle different intents with enhanced data integration
             if intent in ['stock_info', 'stock_analysis'] and symbol:
-                response = self.generate_enhanced_response(intent, symbol, context)
+                # Blocking file reads and predictor calls run on a worker
+                # thread so the event loop stays free for other sessions
+                response = await asyncio.to_thread(self.generate_enhanced_response,
+                                                   intent, symbol, context)
                 suggestions = [
                     f"Get {symbol} price prediction",
                     f"Analyze {symbol} technical indicators",
@@ -456,7 +757,8 @@ Would you like a detailed technical analysis or price prediction for {symbol}?""
                 # Use stock predictor for predictions
                 if self.stock_predictor:
                     try:
-                        prediction = self.stock_predictor.predict(symbol, 7, 'lstm')
+                        prediction = await asyncio.to_thread(self.stock_predictor.predict,
+                                                             symbol, 7, 'lstm')
                         pred_text = "\n".join([f"   • {date}: ${price:.2f}" for date, price in zip(prediction['dates'], prediction['predictions'])])
                         response = f"""🔮 **{symbol} Price Prediction (7 Days)**
 
@@ -479,8 +781,7 @@ Would you like a detailed technical analysis or price prediction for {symbol}?""
                 ]
             
             elif intent == 'market_sentiment' and symbol:
-                news_data = self.load_news_data(symbol)
-                sentiment_data = self.analyze_news_sentiment(news_data)
+                sentiment_data = await asyncio.to_thread(self.analyze_news_sentiment, symbol)
                 
                 response = f"""🎭 **{symbol} Market Sentiment**
 
@@ -573,10 +874,10 @@ Try asking me about a specific stock like "Tell me about AAPL" or "Analyze TSLA
         """Get contextual suggestions based on session history"""
         if context is None or not isinstance(context, dict):
             context = {}
-        context.setdefault('stock_interests', [])
-        
-        if context['stock_interests']:
-            symbols = context['stock_interests'][-3:]  # Last 3 stocks
+        stock_interests = context.get('stock_interests') or []
+
+        if stock_interests:
+            symbols = stock_interests[-3:]  # Last 3 stocks
             suggestions = []
             for symbol in symbols:
                 suggestions.extend([